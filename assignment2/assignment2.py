@@ -5,43 +5,117 @@ module provides functions for reading and processing employee and meeting data,
 manipulating dictionaries and sets, working with environment variables,
 and more.
 """
+import calendar
 import csv
+import functools
+import itertools
+import logging
+import operator
 import os
-import traceback
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Tuple
 from datetime import datetime
 import custom_module
 
+logger = logging.getLogger(__name__)
+
 
 # Task 2: Read employees from CSV file
+EMPLOYEES_CSV = '../csv/employees.csv'
+# The parsed employees are cached beside this module, not in the shared
+# csv data directory
+EMPLOYEES_CACHE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '__pycache__',
+    'employees.pkl')
+
+
+def _intern_row(row: List[str]) -> Tuple[str, ...]:
+    """Return row as a tuple of interned strings."""
+    return tuple(sys.intern(cell) for cell in row)
+
+
+def _employees_cache_key() -> Tuple[str, float]:
+    """Identify the CSV the cache was built from: its path and mtime."""
+    return os.path.abspath(EMPLOYEES_CSV), os.path.getmtime(EMPLOYEES_CSV)
+
+
+def _load_employees_cache(key: Tuple[str, float]) -> Dict[str, Any]:
+    """
+    Return the pickled employees dict if it was built from the CSV that
+    key identifies, otherwise an empty dict.
+
+    Unpickling runs whatever the file contains, so the cache is only
+    read from this module's own directory; a cache that is stale,
+    unreadable or not shaped like read_employees' result is a miss.
+    """
+    try:
+        with open(EMPLOYEES_CACHE, 'rb') as cache_file:
+            cached_key, employees_dict = pickle.load(cache_file)
+        if cached_key != key:
+            return {}
+        # pickle does not keep strings interned, so intern them again
+        return {'fields': [sys.intern(field)
+                           for field in employees_dict['fields']],
+                'rows': list(map(_intern_row, employees_dict['rows']))}
+    except Exception:      # pylint: disable=broad-exception-caught
+        return {}
+
+
+def _save_employees_cache(key: Tuple[str, float],
+                          employees_dict: Dict[str, Any]) -> None:
+    """
+    Pickle the parsed employees dict to EMPLOYEES_CACHE.
+
+    The pickle is written to a temporary file first and then moved into
+    place, so readers never see a partly written cache.
+    """
+    temp_path = EMPLOYEES_CACHE + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(EMPLOYEES_CACHE), exist_ok=True)
+        with open(temp_path, 'wb') as cache_file:
+            pickle.dump((key, employees_dict), cache_file,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, EMPLOYEES_CACHE)
+    except OSError:
+        # The cache is only an optimisation
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
 def read_employees() -> Dict[str, Any]:
-    """Read employees from csv file and return as dictionary."""
+    """
+    Read employees from csv file and return as dictionary.
+
+    Rows are stored as tuples of interned strings.  The parsed result is
+    cached on disk and reused until the CSV file changes.
+    """
     employees_dict: Dict[str, Any] = {}
-    row_list: List[List[Any]] = []
     try:
-        with open('../csv/employees.csv', 'r', encoding='utf-8') as file:
+        key = _employees_cache_key()
+        cached = _load_employees_cache(key)
+        if cached:
+            return cached
+        with open(EMPLOYEES_CSV, 'r', encoding='utf-8') as file:
             reader = csv.reader(file)
             headers = next(reader)
             employees_dict['fields'] = headers
-            for row in reader:
-                row_list.append(row)
-            employees_dict['rows'] = row_list
-    except Exception as e:      # pylint: disable=broad-exception-caught
-        trace_back = traceback.extract_tb(e.__traceback__)
-        stack_trace = []
-        for trace in trace_back:
-            stack_trace.append(f'File : {trace[0]} , Line : {trace[1]},'
-                               f'Func.Name : {trace[2]}, Message : {trace[3]}')
-        print(f"Exception type: {type(e).__name__}")
-        message = str(e)
-        if message:
-            print(f"Exception message: {message}")
-        print(f"Stack trace: {stack_trace}")
+            employees_dict['rows'] = list(map(_intern_row, reader))
+        _save_employees_cache(key, employees_dict)
+    except Exception:      # pylint: disable=broad-exception-caught
+        logger.exception("Failed reading %s", EMPLOYEES_CSV)
     return employees_dict
 
 
-# Initialize employees global variable
-employees = read_employees()
+# employees and the other data globals below are loaded on first use
+# through these cached getters; see __getattr__ at the end of the module.
+@functools.lru_cache(maxsize=1)
+def get_employees() -> Dict[str, Any]:
+    """Return the employees dict, reading it on the first call."""
+    return read_employees()
 
 
 # Task 3: Find the Column Index
@@ -49,11 +123,42 @@ def column_index(column_name: str) -> int:
     """
     Find the index of a column in the employees fields.
     """
-    return employees["fields"].index(column_name)
+    return get_employees()["fields"].index(column_name)
+
+
+@functools.lru_cache(maxsize=1)
+def get_employee_id_column() -> int:
+    """Return the index of the employee_id column."""
+    return column_index("employee_id")
+
+
+def build_employee_index() -> Dict[int, List[Tuple[str, ...]]]:
+    """
+    Map each employee_id to the rows that carry it, so lookups do not
+    have to scan and convert every row.
+    """
+    id_column = get_employee_id_column()
+    index: Dict[int, List[Tuple[str, ...]]] = {}
+    for row in get_employees()["rows"]:
+        index.setdefault(int(row[id_column]), []).append(row)
+    return index
 
 
-# Store employee_id column index in global variable
-employee_id_column = column_index("employee_id")
+@functools.lru_cache(maxsize=1)
+def get_employees_by_id() -> Dict[int, List[Tuple[str, ...]]]:
+    """Return the employee_id lookup, building it on the first call."""
+    return build_employee_index()
+
+
+@functools.lru_cache(maxsize=1)
+def get_employee_dict_columns() -> Tuple[List[str], List[int]]:
+    """
+    Return the fields kept by employee_dict (everything except
+    employee_id) and the indexes of their columns.
+    """
+    fields = [field for field in get_employees()["fields"]
+              if field != "employee_id"]
+    return fields, list(map(column_index, fields))
 
 
 # Task 4: Find the Employee First Name
@@ -61,7 +166,7 @@ def first_name(row_number: int) -> str:
     """
     Find the first name at the specified row.
     """
-    row = employees["rows"][row_number]
+    row = get_employees()["rows"][row_number]
     first_name_column = column_index("first_name")
     return row[first_name_column]
 
@@ -71,20 +176,17 @@ def employee_find(employee_id: int) -> list:
     """
     Find employees with the specified employee_id.
     """
-    def employee_match(row: list) -> bool:
-        return int(row[employee_id_column]) == employee_id
-    matches = list(filter(employee_match, employees["rows"]))
-    return matches
+    return list(get_employees_by_id().get(employee_id, []))
 
 
 # Task 6: Find the Employee with a Lambda
 def employee_find_2(employee_id: int) -> list:
     """
-    Find employees with the specified employee_id using a lambda.
+    Find employees with the specified employee_id.
+
+    Uses the same employee_id index as employee_find.
     """
-    matches = list(filter(lambda row: int(row[employee_id_column]) ==
-                          employee_id, employees["rows"]))
-    return matches
+    return list(get_employees_by_id().get(employee_id, []))
 
 
 # Task 7: Sort the Rows by last_name Using a Lambda
@@ -93,8 +195,9 @@ def sort_by_last_name() -> list:
     Sort employees by last name.
     """
     last_name_column = column_index("last_name")
-    employees["rows"].sort(key=lambda row: row[last_name_column])
-    return employees["rows"]
+    rows = get_employees()["rows"]
+    rows.sort(key=operator.itemgetter(last_name_column))
+    return rows
 
 
 # Task 8: Create a dict for an Employee
@@ -102,24 +205,25 @@ def employee_dict(row: list) -> dict:
     """
     Create a dictionary for an employee from a row.
     """
-    result = {}
-    fields = employees["fields"]
-    for i, field in enumerate(fields):
-        if field != "employee_id":  # Skip employee_id
-            result[field] = row[i]
-    return result
+    fields, indexes = get_employee_dict_columns()
+    # map(row.__getitem__, ...) always yields one value per field, where
+    # itemgetter would return a bare cell for a single column
+    return dict(zip(fields, map(row.__getitem__, indexes)))
 
 
 # Task 9: A dict of dicts, for All Employees
 def all_employees_dict():
     """
-    Create a dictionary of dictionaries for all employees.
+    Create a dictionary of dictionaries for all employees, keyed by
+    employee_id.
+
+    Each value is the same plain dict employee_dict builds, using the
+    column lists it shares with employee_dict.
     """
-    result = {}
-    for row in employees["rows"]:
-        employee_id = row[employee_id_column]
-        result[employee_id] = employee_dict(row)
-    return result
+    id_column = get_employee_id_column()
+    fields, indexes = get_employee_dict_columns()
+    return {row[id_column]: dict(zip(fields, map(row.__getitem__, indexes)))
+            for row in get_employees()["rows"]}
 
 
 # Task 10: Working with environment variables using the os module
@@ -146,53 +250,51 @@ def set_that_secret(new_secret):
 
 
 # Task 12: Read minutes1.csv and minutes2.csv
+def read_csv_rows(filename):
+    """
+    Return a csv.reader over a CSV file whose contents are read and
+    decoded in one go.
+    """
+    with open(filename, "rb") as csv_file:
+        text = csv_file.read().decode("utf-8")
+    return csv.reader(text.splitlines())
+
+
 def read_csv_to_dict(filename):
     """
     Helper function to read a CSV file and return a dict with fields
     and rows as tuples.
     """
     result_dict = {}
-    rows_list = []
     try:
-        with open(filename, "r", encoding="utf-8") as csv_file:
-            csv_reader = csv.reader(csv_file)
-            # Get the first row (headers) and store in dict
-            first_row = next(csv_reader)
-            result_dict["fields"] = first_row
-            # Store all other rows as tuples in the rows list
-            for row in csv_reader:
-                rows_list.append(tuple(row))
-            # Add rows list to the result dictionary
-            result_dict["rows"] = rows_list
-    except Exception as e:  # pylint: disable=broad-except
-        trace_back = traceback.extract_tb(e.__traceback__)
-        stack_trace = list()
-        for trace in trace_back:
-            stack_trace.append(
-                f'File: {trace[0]}, '
-                f'Line: {trace[1]}, '
-                f'Func.Name: {trace[2]}, '
-                f'Message: {trace[3]}'
-            )
-        print(f"Exception type: {type(e).__name__}")
-        message = str(e)
-        if message:
-            print(f"Exception message: {message}")
-        print(f"Stack trace: {stack_trace}")
+        csv_reader = read_csv_rows(filename)
+        # Get the first row (headers) and store in dict
+        first_row = next(csv_reader)
+        result_dict["fields"] = first_row
+        # Store all other rows as tuples in the rows list
+        result_dict["rows"] = list(map(_intern_row, csv_reader))
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Failed reading %s", filename)
     return result_dict
 
 
 def read_minutes():
     """
     Read minutes1.csv and minutes2.csv files.
+
+    The two files are read concurrently so one file's I/O overlaps the
+    other's.
     """
-    mins1 = read_csv_to_dict("../csv/minutes1.csv")
-    mins2 = read_csv_to_dict("../csv/minutes2.csv")
-    return mins1, mins2
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future1 = executor.submit(read_csv_to_dict, "../csv/minutes1.csv")
+        future2 = executor.submit(read_csv_to_dict, "../csv/minutes2.csv")
+        return future1.result(), future2.result()
 
 
-# Initialize minutes1 and minutes2 global variables
-minutes1, minutes2 = read_minutes()
+@functools.lru_cache(maxsize=1)
+def get_minutes() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return (minutes1, minutes2), reading them on the first call."""
+    return read_minutes()
 
 
 # Task 13: Create minutes_set
@@ -200,80 +302,119 @@ def create_minutes_set():
     """
     Create a set from the rows of minutes1 and minutes2.
     """
-    set1 = set(minutes1["rows"])
-    set2 = set(minutes2["rows"])
-    # Combine both sets (union)
-    return set1.union(set2)
+    minutes1, minutes2 = get_minutes()
+    # Build one set from both row lists
+    return set(itertools.chain(minutes1["rows"], minutes2["rows"]))
 
 
-# Initialize minutes_set global variable
-minutes_set = create_minutes_set()
+@functools.lru_cache(maxsize=1)
+def get_minutes_set() -> set:
+    """Return minutes_set, building it on the first call."""
+    return create_minutes_set()
 
 
 # Task 14: Convert to datetime
+DATE_FORMAT = "%B %d, %Y"
+MONTH_NUMBERS = {name: number
+                 for number, name in enumerate(calendar.month_name) if name}
+
+
+@functools.lru_cache(maxsize=None)
+def parse_minutes_date(date_string: str) -> datetime:
+    """
+    Parse a "%B %d, %Y" date such as "November 15, 1991".
+
+    Results are cached per string, and the month name is looked up in a
+    table instead of going through datetime.strptime.
+    """
+    month, day, year = date_string.replace(",", "").split()
+    return datetime(int(year), MONTH_NUMBERS[month], int(day))
+
+
 def create_minutes_list():
     """
     Create a list from minutes_set with datetime objects.
     """
-    # Convert set to list
-    result_list = list(minutes_set)
-    # Use map to convert dates to datetime objects
-    result_list = list(map(
-        lambda x: (x[0], datetime.strptime(x[1], "%B %d, %Y")),
-        result_list
-    ))
-    return result_list
+    return [(name, parse_minutes_date(date))
+            for name, date in get_minutes_set()]
 
 
-# Initialize minutes_list global variable
-minutes_list = create_minutes_list()
+@functools.lru_cache(maxsize=1)
+def get_minutes_list() -> List[Tuple[str, datetime]]:
+    """Return minutes_list, building it on the first call."""
+    return create_minutes_list()
 
 
 # Task 15: Write Out Sorted List
+# 1 MiB write buffer so minutes.csv goes out in as few write() calls
+# as possible
+WRITE_BUFFER_SIZE = 1 << 20
+
+
 def write_sorted_list() -> List[Tuple[str, str]]:
     """
     Sort minutes_list by date and write to a CSV file.
     Returns:
         List of tuples with meeting names and formatted date strings
     """
-    # Sort by date (second element in each tuple)
-    sorted_list = sorted(minutes_list, key=lambda x: x[1])
-    # Convert dates back to strings
-    converted_list = list(map(
-        lambda x: (x[0], x[1].strftime("%B %d, %Y")),
-        sorted_list
-    ))
+    # Sort by date (second element in each tuple) and convert the dates
+    # back to strings in the same pass
+    converted_list = [
+        (name, date.strftime(DATE_FORMAT))
+        for name, date in sorted(get_minutes_list(),
+                                 key=operator.itemgetter(1))
+    ]
     try:
         with open(
             "./minutes.csv",
             "w",
             newline='',
-            encoding="utf-8"
+            encoding="utf-8",
+            buffering=WRITE_BUFFER_SIZE
         ) as csv_file:
             csv_writer = csv.writer(csv_file)
             # Write headers first
-            csv_writer.writerow(minutes1["fields"])
+            csv_writer.writerow(get_minutes()[0]["fields"])
             # Write all rows
-            for row in converted_list:
-                csv_writer.writerow(row)
-    except Exception as e:  # pylint: disable=broad-except
-        trace_back = traceback.extract_tb(e.__traceback__)
-        stack_trace = list()
-        for trace in trace_back:
-            stack_trace.append(
-                f'File : {trace[0]} , Line : {trace[1]}, '
-                f'Func.Name : {trace[2]}, Message : {trace[3]}'
-            )
-        print(f"Exception type: {type(e).__name__}")
-        message = str(e)
-        if message:
-            print(f"Exception message: {message}")
-        print(f"Stack trace: {stack_trace}")
+            csv_writer.writerows(converted_list)
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Failed writing ./minutes.csv")
     return converted_list
 
 
+# Module-level data globals, resolved lazily (PEP 562)
+_LAZY_GLOBALS = {
+    "employees": get_employees,
+    "employee_id_column": get_employee_id_column,
+    "employees_by_id": get_employees_by_id,
+    "minutes1": lambda: get_minutes()[0],
+    "minutes2": lambda: get_minutes()[1],
+    "minutes_set": get_minutes_set,
+    "minutes_list": get_minutes_list,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Load the data globals (employees, minutes1, ...) on first access so
+    importing the module does no file I/O.
+    """
+    try:
+        getter = _LAZY_GLOBALS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+    return getter()
+
+
 # Main execution block
 if __name__ == "__main__":
+    employees = get_employees()
+    employee_id_column = get_employee_id_column()
+    minutes1, minutes2 = get_minutes()
+    minutes_set = get_minutes_set()
+    minutes_list = get_minutes_list()
+
     # Print employees data
     print("Employees:", employees)
 
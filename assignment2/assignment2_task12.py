@@ -4,62 +4,82 @@ Module for reading and processing CSV files containing meeting minutes.
 This module provides functions to read CSV files into dictionary structures.
 """
 import csv
-import traceback
+import functools
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def _intern_row(row):
+    """Return row as a tuple of interned strings."""
+    return tuple(sys.intern(cell) for cell in row)
 
 
 # Task 12: Read minutes1.csv and minutes2.csv
+def read_csv_rows(filename):
+    """
+    Return a csv.reader over a CSV file whose contents are read and
+    decoded in one go.
+    """
+    with open(filename, "rb") as csv_file:
+        text = csv_file.read().decode("utf-8")
+    return csv.reader(text.splitlines())
+
+
 def read_csv_to_dict(filename):
     """
     Helper function to read a CSV file and return a dict with fields
     and rows as tuples.
     """
     result_dict = {}
-    rows_list = []
-
     try:
-        with open(filename, "r", encoding="utf-8") as csv_file:
-            csv_reader = csv.reader(csv_file)
-
-            # Get the first row (headers) and store in dict
-            first_row = next(csv_reader)
-            result_dict["fields"] = first_row
-
-            # Store all other rows as tuples in the rows list
-            for row in csv_reader:
-                rows_list.append(tuple(row))
-
-            # Add rows list to the result dictionary
-            result_dict["rows"] = rows_list
-
-    except Exception as e:  # pylint: disable=broad-except
-        trace_back = traceback.extract_tb(e.__traceback__)
-        stack_trace = list()
-        for trace in trace_back:
-            stack_trace.append(
-                f'File: {trace[0]}, '
-                f'Line: {trace[1]}, '
-                f'Func.Name: {trace[2]}, '
-                f'Message: {trace[3]}'
-            )
-        print(f"Exception type: {type(e).__name__}")
-        message = str(e)
-        if message:
-            print(f"Exception message: {message}")
-        print(f"Stack trace: {stack_trace}")
-
+        csv_reader = read_csv_rows(filename)
+        # Get the first row (headers) and store in dict
+        first_row = next(csv_reader)
+        result_dict["fields"] = first_row
+        # Store all other rows as tuples in the rows list
+        result_dict["rows"] = list(map(_intern_row, csv_reader))
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Failed reading %s", filename)
     return result_dict
 
 
 def read_minutes():
     """
     Read minutes1.csv and minutes2.csv files.
+
+    The two files are read concurrently so one file's I/O overlaps the
+    other's.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future1 = executor.submit(read_csv_to_dict, "../csv/minutes1.csv")
+        future2 = executor.submit(read_csv_to_dict, "../csv/minutes2.csv")
+        return future1.result(), future2.result()
+
+
+@functools.lru_cache(maxsize=1)
+def get_minutes():
+    """
+    Return (minutes1, minutes2), reading the files on the first call.
+    """
+    return read_minutes()
+
+
+def __getattr__(name):
+    """
+    Resolve the minutes1 and minutes2 globals on first access (PEP 562),
+    so importing this module does not read any files.
     """
-    mins1 = read_csv_to_dict("../csv/minutes1.csv")
-    mins2 = read_csv_to_dict("../csv/minutes2.csv")
-    return mins1, mins2
+    if name == "minutes1":
+        return get_minutes()[0]
+    if name == "minutes2":
+        return get_minutes()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-# Call read_minutes and store results in global variables
-minutes1, minutes2 = read_minutes()
-print("Minutes1:", minutes1)
-print("Minutes2:", minutes2)
+if __name__ == "__main__":
+    minutes1, minutes2 = get_minutes()
+    print("Minutes1:", minutes1)
+    print("Minutes2:", minutes2)
@@ -3,7 +3,9 @@
 This module contains functions for processing minutes data from task12
 and creating a set from the combined rows of minutes1 and minutes2.
 """
-from assignment2_task12 import minutes1, minutes2
+import functools
+import itertools
+from assignment2_task12 import get_minutes
 
 
 # Task 13: Create minutes_set
@@ -11,15 +13,27 @@ def create_minutes_set():
     """
     Create a set from the rows of minutes1 and minutes2.
     """
-    set1 = set(minutes1["rows"])
-    set2 = set(minutes2["rows"])
+    minutes1, minutes2 = get_minutes()
+    # Build one set from both row lists
+    return set(itertools.chain(minutes1["rows"], minutes2["rows"]))
 
-    # Combine both sets (union)
-    return set1.union(set2)
 
+@functools.lru_cache(maxsize=1)
+def get_minutes_set():
+    """
+    Return minutes_set, building it on the first call.
+    """
+    return create_minutes_set()
+
+
+def __getattr__(name):
+    """
+    Resolve the minutes_set global on first access (PEP 562).
+    """
+    if name == "minutes_set":
+        return get_minutes_set()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Call create_minutes_set and store in global variable
-minutes_set = create_minutes_set()
 
 if __name__ == "__main__":
-    print("Minutes Set:", minutes_set)
+    print("Minutes Set:", get_minutes_set())
@@ -1,28 +1,120 @@
 #!/usr/bin/env python3
 """
 This module converts meeting minutes data to datetime objects.
-It transforms the string dates from minutes_set into Python datetime objects
-and creates a list of tuples with meeting information.
+It reads the minutes CSV files, converts their string dates into Python
+datetime objects and creates a list of unique meeting tuples, ordered by date.
 """
+import calendar
+import functools
+import logging
+import sys
+from operator import itemgetter
 from datetime import datetime
-from assignment2_task13 import minutes_set
+from assignment2_task12 import read_csv_rows
+
+logger = logging.getLogger(__name__)
+
+MINUTES_FILES = ("../csv/minutes1.csv", "../csv/minutes2.csv")
+MONTH_NUMBERS = {name: number
+                 for number, name in enumerate(calendar.month_name) if name}
+
+
+@functools.lru_cache(maxsize=None)
+def parse_minutes_date(date_string):
+    """
+    Parse a "%B %d, %Y" date such as "November 15, 1991".
+
+    Results are cached per string, and the month name is looked up in a
+    table instead of going through datetime.strptime.
+    """
+    month, day, year = date_string.replace(",", "").split()
+    return datetime(int(year), MONTH_NUMBERS[month], int(day))
+
+
+def build_minutes(filenames=MINUTES_FILES):
+    """
+    Read the minutes CSV files in one pass and return their headers
+    together with their unique rows as (name, datetime) tuples.
+
+    Rows are de-duplicated on their (name, date string) pair, as the
+    minutes_set union in task 13 does, and each new date is parsed as
+    soon as it is read.  Blank or malformed rows are skipped, and a file
+    that cannot be read is logged and left out.
+    """
+    fields = []
+    seen = {}
+    for filename in filenames:
+        try:
+            csv_reader = read_csv_rows(filename)
+            fields = next(csv_reader)    # Keep the headers out of the rows
+            for row in csv_reader:
+                if len(row) != 2:
+                    continue
+                name, date = row
+                if (name, date) in seen:
+                    continue
+                try:
+                    parsed = parse_minutes_date(date)
+                except (ValueError, KeyError):
+                    continue
+                seen[sys.intern(name), sys.intern(date)] = parsed
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed reading %s", filename)
+    return fields, [(name, parsed) for (name, _), parsed in seen.items()]
+
+
+def build_sorted_minutes():
+    """
+    Return the minutes headers and the unique meetings ordered by date.
+    """
+    fields, result_list = build_minutes()
+    result_list.sort(key=itemgetter(1))
+    return fields, result_list
 
 
 # Task 14: Convert to datetime
 def create_minutes_list():
     """
-    Create a list from minutes_set with datetime objects.
+    Create a list of unique meetings with datetime objects.
+
+    The list is ordered by date, so consumers such as write_sorted_list
+    do not have to sort it again.
     """
-    # Convert set to list
-    result_list = list(minutes_set)
-    # Use map to convert dates to datetime objects
-    result_list = list(map(
-        lambda x: (x[0], datetime.strptime(x[1], "%B %d, %Y")),
-        result_list
-    ))
+    _, result_list = build_sorted_minutes()
     return result_list
 
 
-# Call create_minutes_list and store in global variable
-minutes_list = create_minutes_list()
-print("Minutes List:", minutes_list)
+@functools.lru_cache(maxsize=1)
+def get_minutes_table():
+    """
+    Return the minutes headers and minutes_list, building them on the
+    first call.
+    """
+    return build_sorted_minutes()
+
+
+def get_minutes_list():
+    """
+    Return minutes_list, building it on the first call.
+    """
+    return get_minutes_table()[1]
+
+
+def get_minutes_fields():
+    """
+    Return the minutes CSV headers, reading them on the first call.
+    """
+    return get_minutes_table()[0]
+
+
+def __getattr__(name):
+    """
+    Resolve the minutes_list global on first access (PEP 562).
+    """
+    if name == "minutes_list":
+        return get_minutes_list()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    print("Minutes List:", get_minutes_list())
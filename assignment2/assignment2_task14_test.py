@@ -4,6 +4,7 @@ Test module for the minutes list creation functionality in assignment2 package.
 This module verifies that the create_minutes_list function correctly generates
 a list of tuples containing meeting information with proper datetime objects.
 """
+from datetime import datetime
 import assignment2_task14 as a2
 
 
@@ -21,3 +22,49 @@ def test_create_minutes_list():
     assert type(minutes_list[0][1]).__name__ == "datetime"
     assert type(minutes_list[0]).__name__ == "tuple"
     assert a2.minutes_list is not None
+
+
+def test_build_minutes_dedups_and_sorts(tmp_path):
+    """
+    Test that build_minutes merges the files into unique meetings.
+
+    This test verifies:
+    1. Rows repeated within or across files appear only once
+    2. Blank, malformed and unparseable rows are skipped
+    3. A missing file is skipped instead of raising
+    4. Dates are parsed into datetime objects
+    """
+    first = tmp_path / "first.csv"
+    second = tmp_path / "second.csv"
+    first.write_text(
+        "Name,Date\n"
+        "Ann,\"March 08, 1981\"\n"
+        "\n"
+        "Bob,\"September 20, 1980\",extra\n"
+        "Bob,\"September 20, 1980\"\n",
+        encoding="utf-8",
+    )
+    second.write_text(
+        "Name,Date\n"
+        "Ann,\"March 08, 1981\"\n"
+        "Cy,\"Smarch 01, 1990\"\n"
+        "Cy,\"December 17, 1981\"\n",
+        encoding="utf-8",
+    )
+    filenames = (str(first), str(tmp_path / "missing.csv"), str(second))
+
+    fields, rows = a2.build_minutes(filenames)
+    assert fields == ["Name", "Date"]
+    assert sorted(name for name, _ in rows) == ["Ann", "Bob", "Cy"]
+    assert dict(rows)["Cy"] == datetime(1981, 12, 17)
+
+
+def test_minutes_list_is_sorted_and_unique():
+    """
+    Test that minutes_list holds the 46 unique meetings in date order.
+    """
+    minutes_list = a2.create_minutes_list()
+    dates = [date for _, date in minutes_list]
+    assert len(minutes_list) == len(set(minutes_list)) == 46
+    assert dates == sorted(dates)
+    assert a2.get_minutes_fields() == ["Name", "Date"]
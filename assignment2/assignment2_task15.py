@@ -1,66 +1,57 @@
 #!/usr/bin/env python3
 """
 Minutes processing utility module.
-This module provides functions for sorting meeting minutes data by date
-and writing the results to a CSV file. It handles date formatting and
-includes comprehensive error handling during file operations.
+This module writes the date-ordered meeting minutes from task 14 to a
+CSV file. It handles date formatting and includes comprehensive error
+handling during file operations.
 """
 import csv
-import traceback
+import logging
 from typing import List, Tuple
-from assignment2_task14 import minutes_list
+from assignment2_task14 import get_minutes_list, get_minutes_fields
 
-# Import minutes1 for the fields
-from assignment2_task12 import minutes1
+logger = logging.getLogger(__name__)
+
+
+DATE_FORMAT = "%B %d, %Y"
+# 1 MiB write buffer so minutes.csv goes out in as few write() calls
+# as possible
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 # Task 15: Write Out Sorted List
 def write_sorted_list() -> List[Tuple[str, str]]:
     """
-    Sort minutes_list by date and write to a CSV file.
+    Write minutes_list, which is already ordered by date, to a CSV file.
 
     Returns:
         List of tuples with meeting names and formatted date strings
     """
-    # Sort by date (second element in each tuple)
-    sorted_list = sorted(minutes_list, key=lambda x: x[1])
-
-    # Convert dates back to strings
-    converted_list = list(map(
-        lambda x: (x[0], x[1].strftime("%B %d, %Y")),
-        sorted_list
-    ))
+    # minutes_list is built in date order, so only the dates need
+    # converting back to strings
+    converted_list = [(name, date.strftime(DATE_FORMAT))
+                      for name, date in get_minutes_list()]
 
     try:
         with open(
             "./minutes.csv",
             "w",
             newline='',
-            encoding="utf-8"
+            encoding="utf-8",
+            buffering=WRITE_BUFFER_SIZE
         ) as csv_file:
             csv_writer = csv.writer(csv_file)
             # Write headers first
-            csv_writer.writerow(minutes1["fields"])
+            csv_writer.writerow(get_minutes_fields())
             # Write all rows
-            for row in converted_list:
-                csv_writer.writerow(row)
-    except Exception as e:  # pylint: disable=broad-except
-        trace_back = traceback.extract_tb(e.__traceback__)
-        stack_trace = list()
-        for trace in trace_back:
-            stack_trace.append(
-                f'File : {trace[0]} , Line : {trace[1]}, '
-                f'Func.Name : {trace[2]}, Message : {trace[3]}'
-            )
-        print(f"Exception type: {type(e).__name__}")
-        message = str(e)
-        if message:
-            print(f"Exception message: {message}")
-        print(f"Stack trace: {stack_trace}")
+            csv_writer.writerows(converted_list)
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Failed writing ./minutes.csv")
 
     return converted_list
 
 
-# Call write_sorted_list
-final_sorted_list = write_sorted_list()
-print("Final Sorted List:", final_sorted_list)
+if __name__ == "__main__":
+    # Call write_sorted_list
+    final_sorted_list = write_sorted_list()
+    print("Final Sorted List:", final_sorted_list)
@@ -5,10 +5,33 @@ This module contains unit tests for all functions in the assignment2 module,
 verifying their functionality against expected outputs.
 """
 import os
+import subprocess
+import sys
 import custom_module
 import assignment2 as a2
 
 
+def test_import_reads_no_files():
+    """Test that importing assignment2 opens no files; the data globals
+      are only loaded when first used."""
+    # Run in a fresh interpreter, since this module has already imported
+    # assignment2 and touched its globals
+    script = (
+        "import builtins\n"
+        "opened = []\n"
+        "real_open = builtins.open\n"
+        "def spy_open(file, *args, **kwargs):\n"
+        "    opened.append(file)\n"
+        "    return real_open(file, *args, **kwargs)\n"
+        "builtins.open = spy_open\n"
+        "import assignment2\n"
+        "print(opened, assignment2.get_employees.cache_info().currsize)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], check=True,
+                            capture_output=True, text=True)
+    assert result.stdout.split() == ["[]", "0"]
+
+
 def test_read_employees():
     """Test the read_employees function and verify employee data structure."""
     employees = a2.read_employees()
@@ -46,6 +69,17 @@ def test_employee_find_2():
     assert len(match[0]) == 4
 
 
+def test_employee_find_matches_row_scan():
+    """Test that the employee_id index gives the same rows as scanning
+      every row, and no rows for an unknown ID."""
+    for employee_id in range(1, 21):
+        expected = [row for row in a2.employees["rows"]
+                    if int(row[a2.employee_id_column]) == employee_id]
+        assert a2.employee_find(employee_id) == expected
+        assert a2.employee_find_2(employee_id) == expected
+    assert a2.employee_find(999) == []
+
+
 def test_sort_by_last_name():
     """Test the sort_by_last_name function properly sorts employee rows."""
     rows = a2.sort_by_last_name()
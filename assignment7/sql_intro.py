@@ -53,51 +53,67 @@
 
 
 import sqlite3
+import sys
 
 
-def add_publisher(conn, name):
+def print_rows(rows):
+    # Write all rows in one call instead of one print() per row
+    if rows:
+        sys.stdout.write("\n".join(map(str, rows)) + "\n")
+
+
+def connect_db(path):
+    # Open the database in WAL mode with relaxed syncing and a bigger page
+    # cache; the seeding below is many small writes
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+    PRAGMA busy_timeout = 30000;
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;
+    """)
+    return conn
+
+
+def add_publishers(conn, names):
+    # Existing publishers are skipped by the UNIQUE(name) constraint
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM publishers WHERE name = ?", (name,))
-        if cursor.fetchone():
-            print(f"Publisher {name} already exists")
-            return False
-        cursor.execute("INSERT INTO publishers (name) VALUES (?)", (name,))
-        return True
+        cursor = conn.executemany(
+            "INSERT OR IGNORE INTO publishers (name) VALUES (?)",
+            ((name,) for name in names))
+        return cursor.rowcount
     except Exception as e:
-        print(f"Error adding publisher: {e}")
-        return False
+        print(f"Error adding publishers: {e}")
+        return 0
 
 
-def add_magazine(conn, name, publisher_id):
+def add_magazines(conn, magazines):
+    # magazines is an iterable of (name, publisher_name) pairs; the
+    # publisher_id is looked up inside the INSERT, and existing magazines
+    # are skipped by the UNIQUE(name) constraint
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM magazines WHERE name = ?", (name,))
-        if cursor.fetchone():
-            print(f"Magazine {name} already exists")
-            return False
-        cursor.execute("INSERT INTO magazines (name, publisher_id) VALUES (?, ?)", 
-                     (name, publisher_id))
-        return True
+        cursor = conn.executemany("""
+            INSERT OR IGNORE INTO magazines (name, publisher_id)
+            SELECT ?, p.publisher_id FROM publishers p WHERE p.name = ?
+            """, magazines)
+        return cursor.rowcount
     except Exception as e:
-        print(f"Error adding magazine: {e}")
-        return False
+        print(f"Error adding magazines: {e}")
+        return 0
 
 
-def add_subscriber(conn, name, address):
+def add_subscribers(conn, subscribers):
+    # subscribers is an iterable of (name, address) pairs; existing
+    # subscribers are skipped by the unique (name, address) index
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM subscribers WHERE name = ? AND address = ?", 
-                     (name, address))
-        if cursor.fetchone():
-            print(f"Subscriber {name} at {address} already exists")
-            return False
-        cursor.execute("INSERT INTO subscribers (name, address) VALUES (?, ?)", 
-                     (name, address))
-        return True
+        cursor = conn.executemany(
+            "INSERT OR IGNORE INTO subscribers (name, address) VALUES (?, ?)",
+            subscribers)
+        return cursor.rowcount
     except Exception as e:
-        print(f"Error adding subscriber: {e}")
-        return False
+        print(f"Error adding subscribers: {e}")
+        return 0
 
 
 def query_all_subscribers(conn):
@@ -105,8 +121,7 @@ def query_all_subscribers(conn):
     cursor.execute("SELECT * FROM subscribers")
     subscribers = cursor.fetchall()
     print("\nAll Subscribers:")
-    for subscriber in subscribers:
-        print(subscriber)
+    print_rows(subscribers)
     return subscribers
 
 def query_magazines_by_name(conn):
@@ -114,8 +129,7 @@ def query_magazines_by_name(conn):
     cursor.execute("SELECT * FROM magazines ORDER BY name")
     magazines = cursor.fetchall()
     print("\nMagazines sorted by name:")
-    for magazine in magazines:
-        print(magazine)
+    print_rows(magazines)
     return magazines
 
 def query_magazines_by_publisher(conn, publisher_name):
@@ -128,28 +142,30 @@ def query_magazines_by_publisher(conn, publisher_name):
     """, (publisher_name,))
     magazines = cursor.fetchall()
     print(f"\nMagazines published by {publisher_name}:")
-    for magazine in magazines:
-        print(magazine)
+    print_rows(magazines)
     return magazines
 
 
-def add_subscription(conn, subscriber_id, magazine_id, expiration_date):
+def add_subscriptions(conn, subscriptions):
+    # subscriptions is an iterable of
+    # (subscriber_name, magazine_name, expiration_date) tuples; both ids
+    # are looked up inside the INSERT, and existing subscriptions are
+    # skipped by the unique (subscriber_id, magazine_id) index
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM subscriptions WHERE subscriber_id = ? AND magazine_id = ?", 
-                     (subscriber_id, magazine_id))
-        if cursor.fetchone():
-            print(f"Subscription already exists")
-            return False
-        cursor.execute("INSERT INTO subscriptions (subscriber_id, magazine_id, expiration_date) VALUES (?, ?, ?)", 
-                     (subscriber_id, magazine_id, expiration_date))
-        return True
+        cursor = conn.executemany("""
+            INSERT OR IGNORE INTO subscriptions (subscriber_id, magazine_id, expiration_date)
+            SELECT s.subscriber_id, m.magazine_id, ?3
+            FROM subscribers s
+            JOIN magazines m ON m.name = ?2
+            WHERE s.name = ?1
+            """, subscriptions)
+        return cursor.rowcount
     except Exception as e:
-        print(f"Error adding subscription: {e}")
-        return False
+        print(f"Error adding subscriptions: {e}")
+        return 0
 
 try:
-    with sqlite3.connect("../db/magazines.db") as conn:
+    with connect_db("../db/magazines.db") as conn:
         # Enable foreign key constraints
         conn.execute("PRAGMA foreign_keys = 1")
         
@@ -194,50 +210,53 @@ try:
         )
         """)
         
+        # Unique indexes let INSERT OR IGNORE skip rows that already exist
+        cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_subscribers_name_address
+        ON subscribers(name, address)
+        """)
+        cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_subscriptions_subscriber_magazine
+        ON subscriptions(subscriber_id, magazine_id)
+        """)
+        
+        # Indexes on the remaining foreign keys used in joins (subscriber_id
+        # is already the leading column of the unique index above)
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_subscriptions_magazine_id
+        ON subscriptions(magazine_id)
+        """)
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_magazines_publisher_id
+        ON magazines(publisher_id)
+        """)
+        
         print("Database created and connected successfully.")
         
         # Add publishers
-        add_publisher(conn, "Conde Nast")
-        add_publisher(conn, "Hearst")
-        add_publisher(conn, "Meredith")
+        add_publishers(conn, ["Conde Nast", "Hearst", "Meredith"])
         
-        # Add magazines (get publisher_ids first)
-        cursor = conn.cursor()
-        cursor.execute("SELECT publisher_id FROM publishers WHERE name = 'Conde Nast'")
-        conde_id = cursor.fetchone()[0]
-        cursor.execute("SELECT publisher_id FROM publishers WHERE name = 'Hearst'")
-        hearst_id = cursor.fetchone()[0]
-        cursor.execute("SELECT publisher_id FROM publishers WHERE name = 'Meredith'")
-        meredith_id = cursor.fetchone()[0]
-        
-        add_magazine(conn, "Vogue", conde_id)
-        add_magazine(conn, "GQ", conde_id)
-        add_magazine(conn, "Cosmopolitan", hearst_id)
-        add_magazine(conn, "Better Homes & Gardens", meredith_id)
+        # Add magazines (by publisher name)
+        add_magazines(conn, [
+            ("Vogue", "Conde Nast"),
+            ("GQ", "Conde Nast"),
+            ("Cosmopolitan", "Hearst"),
+            ("Better Homes & Gardens", "Meredith"),
+        ])
         
         # Add subscribers
-        add_subscriber(conn, "John Smith", "123 Main St")
-        add_subscriber(conn, "Jane Doe", "456 Oak Ave")
-        add_subscriber(conn, "Bob Johnson", "789 Pine Rd")
-        
-        # Add subscriptions (get IDs first)
-        cursor.execute("SELECT subscriber_id FROM subscribers WHERE name = 'John Smith'")
-        john_id = cursor.fetchone()[0]
-        cursor.execute("SELECT subscriber_id FROM subscribers WHERE name = 'Jane Doe'")
-        jane_id = cursor.fetchone()[0]
-        cursor.execute("SELECT subscriber_id FROM subscribers WHERE name = 'Bob Johnson'")
-        bob_id = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT magazine_id FROM magazines WHERE name = 'Vogue'")
-        vogue_id = cursor.fetchone()[0]
-        cursor.execute("SELECT magazine_id FROM magazines WHERE name = 'Cosmopolitan'")
-        cosmo_id = cursor.fetchone()[0]
-        cursor.execute("SELECT magazine_id FROM magazines WHERE name = 'GQ'")
-        gq_id = cursor.fetchone()[0]
-        
-        add_subscription(conn, john_id, vogue_id, "2023-12-31")
-        add_subscription(conn, jane_id, cosmo_id, "2023-10-15")
-        add_subscription(conn, bob_id, gq_id, "2024-01-01")
+        add_subscribers(conn, [
+            ("John Smith", "123 Main St"),
+            ("Jane Doe", "456 Oak Ave"),
+            ("Bob Johnson", "789 Pine Rd"),
+        ])
+        
+        # Add subscriptions (by subscriber and magazine name)
+        add_subscriptions(conn, [
+            ("John Smith", "Vogue", "2023-12-31"),
+            ("Jane Doe", "Cosmopolitan", "2023-10-15"),
+            ("Bob Johnson", "GQ", "2024-01-01"),
+        ])
 
         # Execute queries
         query_all_subscribers(conn)
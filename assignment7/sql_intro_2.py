@@ -45,51 +45,50 @@
 
 
 
+import csv
 import sqlite3
-import pandas as pd
+
+
+def connect_db(path):
+    # Same connection settings as sql_intro.py, which writes this database
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+    PRAGMA busy_timeout = 30000;
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;
+    """)
+    return conn
+
 
 # Connect to the magazines database instead
-conn = sqlite3.connect("../db/magazines.db")
+conn = connect_db("../db/magazines.db")
 
-# Query to get subscription data
+# Count subscriptions and sum their totals per magazine, sorted by
+# magazine name. There is no price or quantity in this database, so each
+# subscription counts as price 1 * quantity 1 and the total is simply the
+# row count. The subscription_id alias on the count is only kept so the
+# CSV header matches the earlier output.
 query = """
-SELECT s.subscription_id, s.subscriber_id, sb.name as subscriber_name, 
-       m.magazine_id, m.name as magazine_name, s.expiration_date
+SELECT m.magazine_id,
+       COUNT(s.subscription_id) AS subscription_id,
+       COUNT(*) AS total,
+       m.name AS magazine_name
 FROM subscriptions s
-JOIN subscribers sb ON s.subscriber_id = sb.subscriber_id
 JOIN magazines m ON s.magazine_id = m.magazine_id
+GROUP BY m.magazine_id
+ORDER BY m.name
 """
 
-# Read data into DataFrame
-df = pd.read_sql_query(query, conn)
-
-# Print first 5 lines
-print("Original DataFrame:")
-print(df.head())
-
-# Create a "total" column (since we don't have price, we'll use 1 as dummy price)
-df['price'] = 1  # Add dummy price
-df['quantity'] = 1  # Add dummy quantity
-df['total'] = df['quantity'] * df['price']
-print("\nDataFrame with 'total' column:")
-print(df.head())
-
-# Group by magazine_id
-summary_df = df.groupby('magazine_id').agg({
-    'subscription_id': 'count',
-    'total': 'sum',
-    'magazine_name': 'first'
-})
-print("\nGrouped DataFrame:")
-print(summary_df.head())
-
-# Sort by magazine_name
-summary_df = summary_df.sort_values('magazine_name')
-print("\nSorted DataFrame:")
-print(summary_df.head())
-
-# Write to CSV
-summary_df.to_csv('order_summary.csv')
-print("\nData written to order_summary.csv")
+# Stream the grouped and sorted summary straight from the cursor to CSV.
+# newline='' leaves line endings to csv.writer, and lineterminator='\n'
+# keeps the "\n" endings pandas' to_csv wrote to order_summary.csv
+cursor = conn.execute(query)
+with open('order_summary.csv', 'w', newline='', encoding='utf-8') as csv_file:
+    writer = csv.writer(csv_file, lineterminator='\n')
+    writer.writerow([column[0] for column in cursor.description])
+    writer.writerows(cursor)
+print("Data written to order_summary.csv")
 
 conn.close()
\ No newline at end of file
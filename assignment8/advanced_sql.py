@@ -1,8 +1,36 @@
 import sqlite3
+import sys
 
-def task1_complex_joins():
+# Row formats for each task's result table
+TASK1_ROW_FORMAT = "{:8} | ${:.2f}"
+TASK2_ROW_FORMAT = "{:15} | ${:.2f}"
+TASK3_ROW_FORMAT = "{:12} | {:8} | {}"
+TASK4_ROW_FORMAT = "{:11} | {:10} | {:9} | {}"
+
+
+def print_rows(row_format, rows):
+    # Format every row and write them with a single call
+    if rows:
+        sys.stdout.write(
+            "\n".join(row_format.format(*row) for row in rows) + "\n")
+
+
+def connect_db(path):
+    # WAL lets the read-only tasks run alongside task 3's insert; the larger
+    # cache keeps the joined tables' pages in memory
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+    PRAGMA busy_timeout = 30000;
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;
+    """)
+    return conn
+
+
+def task1_complex_joins(conn):
     # Task 1: Complex JOINs with Aggregation
-    conn = sqlite3.connect('../db/lesson.db')
     cursor = conn.cursor()
     
     # SQL query to find total price of each of first 5 orders
@@ -22,28 +50,22 @@ def task1_complex_joins():
     print("\nTask 1: Complex JOINs with Aggregation")
     print("Order ID | Total Price")
     print("-" * 25)
-    for row in results:
-        print(f"{row[0]:8} | ${row[1]:.2f}")
-    
-    conn.close()
+    print_rows(TASK1_ROW_FORMAT, results)
 
 
-def task2_subqueries():
+def task2_subqueries(conn):
     # Task 2: Understanding Subqueries
-    conn = sqlite3.connect('../db/lesson.db')
     cursor = conn.cursor()
     
-    # SQL query with subquery to find average order price per customer
+    # Average order price per customer in a single pass over the joins:
+    # total spent divided by the number of orders that have line items
     query = """
-    SELECT c.name, AVG(order_totals.total_price) AS average_total_price
+    SELECT c.name,
+           SUM(p.price * li.quantity) / COUNT(DISTINCT li.order_id) AS average_total_price
     FROM customers c
-    LEFT JOIN (
-        SELECT o.customer_id AS customer_id_b, SUM(p.price * li.quantity) AS total_price
-        FROM orders o
-        JOIN line_items li ON o.order_id = li.order_id
-        JOIN products p ON li.product_id = p.product_id
-        GROUP BY o.order_id
-    ) order_totals ON c.customer_id = order_totals.customer_id_b
+    LEFT JOIN orders o ON c.customer_id = o.customer_id
+    LEFT JOIN line_items li ON o.order_id = li.order_id
+    LEFT JOIN products p ON li.product_id = p.product_id
     GROUP BY c.customer_id;
     """
     
@@ -53,15 +75,11 @@ def task2_subqueries():
     print("\nTask 2: Understanding Subqueries")
     print("Customer Name | Average Order Price")
     print("-" * 40)
-    for row in results:
-        print(f"{row[0]:15} | ${row[1]:.2f}")
-    
-    conn.close()
+    print_rows(TASK2_ROW_FORMAT, results)
 
 
-def task3_transaction():
+def task3_transaction(conn):
     # Task 3: An Insert Transaction Based on Data
-    conn = sqlite3.connect('../db/lesson.db')
     conn.execute("PRAGMA foreign_keys = 1")
     cursor = conn.cursor()
     
@@ -88,12 +106,11 @@ def task3_transaction():
         )
         order_id = cursor.fetchone()[0]
         
-        # Create line_item records
-        for product_id in product_ids:
-            cursor.execute(
-                "INSERT INTO line_items (order_id, product_id, quantity) VALUES (?, ?, ?)",
-                (order_id, product_id, 10)
-            )
+        # Create line_item records with one prepared statement
+        cursor.executemany(
+            "INSERT INTO line_items (order_id, product_id, quantity) VALUES (?, ?, ?)",
+            [(order_id, product_id, 10) for product_id in product_ids]
+        )
         
         # Commit transaction
         conn.commit()
@@ -113,20 +130,15 @@ def task3_transaction():
         print(f"New Order ID: {order_id}")
         print("Line Item ID | Quantity | Product Name")
         print("-" * 45)
-        for row in results:
-            print(f"{row[0]:12} | {row[1]:8} | {row[2]}")
+        print_rows(TASK3_ROW_FORMAT, results)
         
     except Exception as e:
         # Rollback in case of error
         conn.rollback()
         print(f"Error: {e}")
-    
-    finally:
-        conn.close()
 
-def task4_having():
+def task4_having(conn):
     # Task 4: Aggregation with HAVING
-    conn = sqlite3.connect('../db/lesson.db')
     cursor = conn.cursor()
     
     # SQL query to find employees with more than 5 orders
@@ -144,14 +156,16 @@ def task4_having():
     print("\nTask 4: Aggregation with HAVING")
     print("Employee ID | First Name | Last Name | Order Count")
     print("-" * 50)
-    for row in results:
-        print(f"{row[0]:11} | {row[1]:10} | {row[2]:9} | {row[3]}")
-    
-    conn.close()
+    print_rows(TASK4_ROW_FORMAT, results)
 
 
 if __name__ == "__main__":
-    task1_complex_joins()
-    task2_subqueries()
-    task3_transaction()
-    task4_having()
\ No newline at end of file
+    # One connection for all four tasks, so the page cache stays warm
+    conn = connect_db('../db/lesson.db')
+    try:
+        task1_complex_joins(conn)
+        task2_subqueries(conn)
+        task3_transaction(conn)
+        task4_having(conn)
+    finally:
+        conn.close()
\ No newline at end of file
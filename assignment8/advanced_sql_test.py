@@ -0,0 +1,82 @@
+"""
+Test module for advanced_sql.py.
+
+These tests run the task queries against a small in-memory database, so
+they do not depend on ../db/lesson.db.
+"""
+import sqlite3
+import advanced_sql as a8
+
+SCHEMA = """
+CREATE TABLE products (
+    product_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    price REAL NOT NULL
+);
+CREATE TABLE customers (
+    customer_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE orders (
+    order_id INTEGER PRIMARY KEY,
+    customer_id INTEGER,
+    employee_id INTEGER
+);
+CREATE TABLE line_items (
+    line_item_id INTEGER PRIMARY KEY,
+    order_id INTEGER,
+    product_id INTEGER,
+    quantity INTEGER NOT NULL
+);
+"""
+
+# The task 2 query before it was rewritten as a single aggregation
+SUBQUERY_AVERAGES = """
+SELECT c.name, AVG(order_totals.total_price) AS average_total_price
+FROM customers c
+LEFT JOIN (
+    SELECT o.customer_id AS customer_id_b,
+           SUM(p.price * li.quantity) AS total_price
+    FROM orders o
+    JOIN line_items li ON o.order_id = li.order_id
+    JOIN products p ON li.product_id = p.product_id
+    GROUP BY o.order_id
+) order_totals ON c.customer_id = order_totals.customer_id_b
+GROUP BY c.customer_id;
+"""
+
+
+def make_db():
+    """Build an in-memory database where one customer has several orders,
+      one of them without line items."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(SCHEMA)
+    conn.executemany("INSERT INTO products VALUES (?, ?, ?)",
+                     [(1, "Widget", 10.00), (2, "Gadget", 2.50)])
+    conn.executemany("INSERT INTO customers VALUES (?, ?)",
+                     [(1, "Multi"), (2, "Single")])
+    conn.executemany("INSERT INTO orders VALUES (?, ?, ?)",
+                     [(1, 1, 1), (2, 1, 1), (3, 1, 1), (4, 2, 1)])
+    # Order 1 totals 15.00, order 2 totals 30.00, order 3 is empty and
+    # order 4 totals 10.00
+    conn.executemany("INSERT INTO line_items VALUES (?, ?, ?, ?)",
+                     [(1, 1, 1, 1), (2, 1, 2, 2), (3, 2, 1, 3),
+                      (4, 4, 2, 4)])
+    return conn
+
+
+def test_task2_averages_multiple_orders(capsys):
+    """Test that task2_subqueries averages per order, not per line item,
+      and agrees with the original subquery."""
+    conn = make_db()
+    try:
+        expected = conn.execute(SUBQUERY_AVERAGES).fetchall()
+        a8.task2_subqueries(conn)
+    finally:
+        conn.close()
+
+    assert expected == [("Multi", 22.5), ("Single", 10.0)]
+    output = capsys.readouterr().out.splitlines()
+    assert output[-2:] == [
+        a8.TASK2_ROW_FORMAT.format(*row) for row in expected
+    ]
@@ -1,9 +1,24 @@
 import sqlite3
 
-conn = sqlite3.connect("db/lesson.db")
+
+def connect_db(path):
+    # WAL journal, one fsync less per commit and a larger in-memory cache
+    # for the bulk seed below
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+    PRAGMA busy_timeout = 30000;
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;
+    """)
+    return conn
+
+
+conn = connect_db("db/lesson.db")
 cursor = conn.cursor()
 
-# Create tables
+# Create tables and clear existing data
 cursor.executescript('''
 CREATE TABLE IF NOT EXISTS products (
     product_id INTEGER PRIMARY KEY,
@@ -39,78 +54,113 @@ CREATE TABLE IF NOT EXISTS line_items (
     FOREIGN KEY (product_id) REFERENCES products(product_id)
 );
 
+-- Drop the join indexes while reloading; they are rebuilt after the
+-- inserts below
+DROP INDEX IF EXISTS idx_line_items_order_id;
+DROP INDEX IF EXISTS idx_line_items_product_id;
+DROP INDEX IF EXISTS idx_orders_employee_id;
+DROP INDEX IF EXISTS idx_orders_customer_id;
+
 -- Clear existing data
 DELETE FROM line_items;
 DELETE FROM orders;
 DELETE FROM products;
 DELETE FROM customers;
 DELETE FROM employees;
+''')
+
+
+# Sample data, produced row by row so executemany can stream it
+def customer_rows():
+    yield (1, 'Acme Corp')
+    yield (2, 'Perez and Sons')
+    yield (3, 'Global Enterprises')
+
+
+def employee_rows():
+    yield (1, 'John', 'Smith')
+    yield (2, 'Miranda', 'Harris')
+    yield (3, 'Emily', 'Johnson')
 
--- Insert sample data
--- Customers
-INSERT INTO customers VALUES (1, 'Acme Corp');
-INSERT INTO customers VALUES (2, 'Perez and Sons');
-INSERT INTO customers VALUES (3, 'Global Enterprises');
-
--- Employees
-INSERT INTO employees VALUES (1, 'John', 'Smith');
-INSERT INTO employees VALUES (2, 'Miranda', 'Harris');
-INSERT INTO employees VALUES (3, 'Emily', 'Johnson');
-
--- Products
-INSERT INTO products VALUES (1, 'Widget', 10.99);
-INSERT INTO products VALUES (2, 'Gadget', 25.50);
-INSERT INTO products VALUES (3, 'Tool', 15.75);
-INSERT INTO products VALUES (4, 'Component', 8.25);
-INSERT INTO products VALUES (5, 'Accessory', 5.99);
-INSERT INTO products VALUES (6, 'Module', 30.00);
-
--- Orders (adding more so some employees have >5 orders)
-INSERT INTO orders VALUES (1, 1, 1);
-INSERT INTO orders VALUES (2, 1, 2);
-INSERT INTO orders VALUES (3, 2, 1);
-INSERT INTO orders VALUES (4, 3, 3);
-INSERT INTO orders VALUES (5, 2, 2);
-INSERT INTO orders VALUES (6, 1, 3);
-INSERT INTO orders VALUES (7, 3, 1);
-INSERT INTO orders VALUES (8, 2, 3);
--- Additional orders for employee 1 (John Smith)
-INSERT INTO orders VALUES (9, 1, 1);
-INSERT INTO orders VALUES (10, 2, 1);
-INSERT INTO orders VALUES (11, 3, 1);
-INSERT INTO orders VALUES (12, 1, 1);
--- Additional orders for employee 2 (Miranda Harris)
-INSERT INTO orders VALUES (13, 3, 2);
-INSERT INTO orders VALUES (14, 1, 2);
-INSERT INTO orders VALUES (15, 2, 2);
-INSERT INTO orders VALUES (16, 3, 2);
-
--- Line Items
-INSERT INTO line_items VALUES (1, 1, 1, 5);
-INSERT INTO line_items VALUES (2, 1, 2, 2);
-INSERT INTO line_items VALUES (3, 2, 3, 10);
-INSERT INTO line_items VALUES (4, 2, 4, 3);
-INSERT INTO line_items VALUES (5, 3, 1, 7);
-INSERT INTO line_items VALUES (6, 3, 5, 4);
-INSERT INTO line_items VALUES (7, 4, 6, 2);
-INSERT INTO line_items VALUES (8, 4, 2, 5);
-INSERT INTO line_items VALUES (9, 5, 3, 3);
-INSERT INTO line_items VALUES (10, 5, 4, 8);
--- Add line items for new orders
-INSERT INTO line_items VALUES (11, 6, 1, 4);
-INSERT INTO line_items VALUES (12, 7, 2, 6);
-INSERT INTO line_items VALUES (13, 8, 3, 2);
-INSERT INTO line_items VALUES (14, 9, 4, 7);
-INSERT INTO line_items VALUES (15, 10, 5, 3);
-INSERT INTO line_items VALUES (16, 11, 6, 5);
-INSERT INTO line_items VALUES (17, 12, 1, 8);
-INSERT INTO line_items VALUES (18, 13, 2, 4);
-INSERT INTO line_items VALUES (19, 14, 3, 6);
-INSERT INTO line_items VALUES (20, 15, 4, 2);
-INSERT INTO line_items VALUES (21, 16, 5, 5);
+
+def product_rows():
+    yield (1, 'Widget', 10.99)
+    yield (2, 'Gadget', 25.50)
+    yield (3, 'Tool', 15.75)
+    yield (4, 'Component', 8.25)
+    yield (5, 'Accessory', 5.99)
+    yield (6, 'Module', 30.00)
+
+
+# Orders (adding more so some employees have >5 orders)
+def order_rows():
+    yield (1, 1, 1)
+    yield (2, 1, 2)
+    yield (3, 2, 1)
+    yield (4, 3, 3)
+    yield (5, 2, 2)
+    yield (6, 1, 3)
+    yield (7, 3, 1)
+    yield (8, 2, 3)
+    # Additional orders for employee 1 (John Smith)
+    yield (9, 1, 1)
+    yield (10, 2, 1)
+    yield (11, 3, 1)
+    yield (12, 1, 1)
+    # Additional orders for employee 2 (Miranda Harris)
+    yield (13, 3, 2)
+    yield (14, 1, 2)
+    yield (15, 2, 2)
+    yield (16, 3, 2)
+
+
+def line_item_rows():
+    yield (1, 1, 1, 5)
+    yield (2, 1, 2, 2)
+    yield (3, 2, 3, 10)
+    yield (4, 2, 4, 3)
+    yield (5, 3, 1, 7)
+    yield (6, 3, 5, 4)
+    yield (7, 4, 6, 2)
+    yield (8, 4, 2, 5)
+    yield (9, 5, 3, 3)
+    yield (10, 5, 4, 8)
+    # Add line items for new orders
+    yield (11, 6, 1, 4)
+    yield (12, 7, 2, 6)
+    yield (13, 8, 3, 2)
+    yield (14, 9, 4, 7)
+    yield (15, 10, 5, 3)
+    yield (16, 11, 6, 5)
+    yield (17, 12, 1, 8)
+    yield (18, 13, 2, 4)
+    yield (19, 14, 3, 6)
+    yield (20, 15, 4, 2)
+    yield (21, 16, 5, 5)
+
+
+# Insert sample data: one prepared statement per table, all in a single
+# transaction
+with conn:
+    cursor.executemany("INSERT INTO customers VALUES (?, ?)", customer_rows())
+    cursor.executemany("INSERT INTO employees VALUES (?, ?, ?)",
+                       employee_rows())
+    cursor.executemany("INSERT INTO products VALUES (?, ?, ?)", product_rows())
+    cursor.executemany("INSERT INTO orders VALUES (?, ?, ?)", order_rows())
+    cursor.executemany("INSERT INTO line_items VALUES (?, ?, ?, ?)",
+                       line_item_rows())
+
+# Index the foreign keys used in joins once the data is loaded, so each
+# index is built in one pass instead of being updated on every insert
+cursor.executescript('''
+BEGIN;
+CREATE INDEX IF NOT EXISTS idx_line_items_order_id ON line_items(order_id);
+CREATE INDEX IF NOT EXISTS idx_line_items_product_id ON line_items(product_id);
+CREATE INDEX IF NOT EXISTS idx_orders_employee_id ON orders(employee_id);
+CREATE INDEX IF NOT EXISTS idx_orders_customer_id ON orders(customer_id);
+COMMIT;
 ''')
 
-conn.commit()
 conn.close()
 
 print("Database initialized successfully with more orders for Task 4.")
\ No newline at end of file